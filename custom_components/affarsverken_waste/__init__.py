@@ -8,7 +8,7 @@ from dataclasses import dataclass
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.storage import Store
@@ -35,17 +35,36 @@ type AffarsverkenWasteConfigEntry = ConfigEntry[RuntimeData]
 async def async_setup_entry(hass: HomeAssistant, entry: AffarsverkenWasteConfigEntry) -> bool:
     """Set up Affärsverken Waste from a config entry."""
     address = entry.data[CONF_ADDRESS]
-    store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
-    client = AffarsverkenWasteApiClient(hass, store)
+    client = async_get_client(hass)
     coordinator = AffarsverkenWasteCoordinator(hass, entry, client, address)
 
     await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = RuntimeData(client=client, coordinator=coordinator)
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
+async def _async_options_updated(hass: HomeAssistant, entry: AffarsverkenWasteConfigEntry) -> None:
+    """Reload so the coordinator picks up a changed poll interval."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+@callback
+def async_get_client(hass: HomeAssistant) -> AffarsverkenWasteApiClient:
+    """Return the API client shared by every entry, creating it on first use.
+
+    One client means one token and one storage file regardless of how many
+    addresses are configured.
+    """
+    client: AffarsverkenWasteApiClient | None = hass.data.get(DOMAIN)
+    if client is None:
+        store: Store = Store(hass, STORAGE_VERSION, DOMAIN)
+        client = hass.data[DOMAIN] = AffarsverkenWasteApiClient(hass, store)
+    return client
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: AffarsverkenWasteConfigEntry) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -66,20 +85,28 @@ async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     Both steps are idempotent and run from any prior version because
     v0.2.1's migration mistakenly bumped entries to version=2 without
     cleaning up the legacy device.
+
+    v3.1 → v3.2: the token/building cache moved from a per-entry store to
+    one store shared by all entries; delete the orphaned per-entry file.
+    A minor bump, so a downgrade can still load the entry.
     """
-    if entry.version >= 3:
-        return True
+    if entry.version < 3:
+        address = entry.data[CONF_ADDRESS]
+        new_hash = address_slug(address)
+        old_hash = hashlib.md5(address.encode(), usedforsecurity=False).hexdigest()[:8]
 
-    address = entry.data[CONF_ADDRESS]
-    new_hash = address_slug(address)
-    old_hash = hashlib.md5(address.encode(), usedforsecurity=False).hexdigest()[:8]
+        if old_hash != new_hash:
+            _migrate_entities(hass, entry, old_hash, new_hash)
+        _migrate_devices(hass, entry, new_hash)
+
+        hass.config_entries.async_update_entry(entry, version=3)
+        _LOGGER.info("Migrated affarsverken_waste entry %s to v3", entry.entry_id)
 
-    if old_hash != new_hash:
-        _migrate_entities(hass, entry, old_hash, new_hash)
-    _migrate_devices(hass, entry, new_hash)
+    if entry.version == 3 and entry.minor_version < 2:
+        await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+        hass.config_entries.async_update_entry(entry, minor_version=2)
+        _LOGGER.info("Migrated affarsverken_waste entry %s to v3.2", entry.entry_id)
 
-    hass.config_entries.async_update_entry(entry, version=3)
-    _LOGGER.info("Migrated affarsverken_waste entry %s to v3", entry.entry_id)
     return True
 
 
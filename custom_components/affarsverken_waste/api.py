@@ -6,6 +6,7 @@ in `parsers.py`. Anything domain-stable belongs in those modules, not here.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import date
 from typing import Any
@@ -15,6 +16,7 @@ import aiohttp
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
 
 from .cache import WasteCache
 from .const import (
@@ -45,6 +47,10 @@ class AffarsverkenWasteApiClient:
     def __init__(self, hass: HomeAssistant, store: Store) -> None:
         self._session: aiohttp.ClientSession = async_get_clientsession(hass)
         self._cache = WasteCache(store)
+        # Serializes logins so entries refreshing concurrently share one token.
+        self._token_lock = asyncio.Lock()
+        self._headers: dict[str, str] = {}
+        self._headers_token: str | None = None
 
     async def async_validate(self, address: str) -> None:
         """Hit the API to validate credentials and address."""
@@ -59,12 +65,26 @@ class AffarsverkenWasteApiClient:
 
     # --- auth ----------------------------------------------------------------
 
-    async def _get_auth_token(self, *, force_refresh: bool = False) -> str:
-        if not force_refresh:
+    async def _get_auth_token(self) -> str:
+        async with self._token_lock:
             cached = await self._cache.get_token()
             if cached:
                 return cached
-        return await self._fetch_and_store_token()
+            return await self._fetch_and_store_token()
+
+    async def _replace_token(self, rejected: str) -> str:
+        """Return a token other than `rejected`, logging in only if needed.
+
+        Entries share the token, so several may see the same one rejected.
+        Whoever takes the lock first logs in; the rest pick up its token
+        instead of invalidating it and logging in again.
+        """
+        async with self._token_lock:
+            cached = await self._cache.get_token()
+            if cached and cached != rejected:
+                return cached
+            await self._cache.invalidate_token()
+            return await self._fetch_and_store_token()
 
     async def _fetch_and_store_token(self) -> str:
         _LOGGER.debug("Requesting new authentication token")
@@ -89,30 +109,38 @@ class AffarsverkenWasteApiClient:
 
     async def _authed_get(self, url: str) -> Any:
         """GET `url` with auth, retrying once on 401/403 with a fresh token."""
+        token = await self._get_auth_token()
         try:
-            return await self._get_with_token(url, force_refresh=False)
+            return await self._get_with_token(url, token)
         except AuthError:
             _LOGGER.info("Token rejected; retrying with fresh token")
-            await self._cache.invalidate_token()
-            return await self._get_with_token(url, force_refresh=True)
-
-    async def _get_with_token(self, url: str, *, force_refresh: bool) -> Any:
-        token = await self._get_auth_token(force_refresh=force_refresh)
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json",
-        }
+            token = await self._replace_token(token)
+            return await self._get_with_token(url, token)
+
+    async def _get_with_token(self, url: str, token: str) -> Any:
         try:
-            async with self._session.get(url, headers=headers, timeout=_TIMEOUT) as resp:
+            async with self._session.get(
+                url, headers=self._headers_for(token), timeout=_TIMEOUT
+            ) as resp:
                 if resp.status in _AUTH_FAIL_STATUSES:
                     raise AuthError(f"Token rejected: HTTP {resp.status}")
                 resp.raise_for_status()
-                return await resp.json()
+                return await resp.json(loads=json_loads)
         except aiohttp.ClientResponseError as err:
             raise ApiError(f"GET {url} failed: {err.status} {err.message}") from err
         except (aiohttp.ClientError, TimeoutError) as err:
             raise ApiError(f"GET {url} transport error: {err}") from err
 
+    def _headers_for(self, token: str) -> dict[str, str]:
+        """Return request headers for `token`, rebuilt only when it rotates."""
+        if token != self._headers_token:
+            self._headers = {
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/json",
+            }
+            self._headers_token = token
+        return self._headers
+
     # --- building lookup -----------------------------------------------------
 
     async def _resolve_query_param(self, address: str) -> str:
@@ -7,6 +7,7 @@ client doesn't sling around a `dict[str, Any]` whose keys are stringly defined.
 from __future__ import annotations
 
 import logging
+import time
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -17,6 +18,7 @@ from .const import (
     CACHE_KEY_BUILDINGS,
     CACHE_KEY_TOKEN,
     CACHE_KEY_TOKEN_EXPIRY,
+    CACHE_SAVE_DELAY,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,35 +32,62 @@ def _parse_iso_utc(value: str) -> datetime:
     return parsed
 
 
+def _read_token_expiry(data: dict[str, Any]) -> datetime | None:
+    """Parse the persisted token expiry, or None if absent or malformed."""
+    expiry = data.get(CACHE_KEY_TOKEN_EXPIRY)
+    if not expiry:
+        return None
+    try:
+        return _parse_iso_utc(expiry)
+    except ValueError:
+        _LOGGER.debug("Bad cached expiration timestamp; refreshing")
+        return None
+
+
+def _monotonic_deadline(expires_at: datetime | None) -> float | None:
+    """Translate a wall-clock expiry into a `time.monotonic()` deadline."""
+    if expires_at is None:
+        return None
+    return time.monotonic() + (expires_at - datetime.now(UTC)).total_seconds()
+
+
 class WasteCache:
     """Lazy in-memory mirror of the persisted JSON cache."""
 
     def __init__(self, store: Store) -> None:
         self._store = store
         self._data: dict[str, Any] | None = None
+        # Monotonic mirror of CACHE_KEY_TOKEN_EXPIRY: the per-request token
+        # check neither re-parses the ISO string nor reads the wall clock.
+        # Drift after suspend is harmless — a stale token gets a 401 and the
+        # client retries with a fresh one.
+        self._token_deadline: float | None = None
 
     async def _load(self) -> dict[str, Any]:
         if self._data is None:
-            self._data = await self._store.async_load() or {}
+            loaded = await self._store.async_load() or {}
+            # The cache is shared across entries; another caller may have
+            # loaded (and started mutating) it while we were awaiting.
+            if self._data is None:
+                self._data = loaded
+                self._token_deadline = _monotonic_deadline(_read_token_expiry(loaded))
         return self._data
 
-    async def _save(self) -> None:
+    def _schedule_save(self) -> None:
+        """Coalesce writes; Store flushes any pending save on HA shutdown."""
         if self._data is not None:
-            await self._store.async_save(self._data)
+            self._store.async_delay_save(self._dump, CACHE_SAVE_DELAY)
+
+    def _dump(self) -> dict[str, Any]:
+        return self._data or {}
 
     async def get_token(self) -> str | None:
         """Return a cached token if it's still within its expiry window."""
         data = await self._load()
         token = data.get(CACHE_KEY_TOKEN)
-        expiry = data.get(CACHE_KEY_TOKEN_EXPIRY)
-        if not token or not expiry:
-            return None
-        try:
-            expires_at = _parse_iso_utc(expiry)
-        except ValueError:
-            _LOGGER.debug("Bad cached expiration timestamp; refreshing")
+        if not token or self._token_deadline is None:
             return None
-        if datetime.now(UTC) >= expires_at:
+        if time.monotonic() >= self._token_deadline:
             return None
         return token
 
@@ -66,13 +95,15 @@ class WasteCache:
         data = await self._load()
         data[CACHE_KEY_TOKEN] = token
         data[CACHE_KEY_TOKEN_EXPIRY] = expires_at.isoformat()
-        await self._save()
+        self._token_deadline = _monotonic_deadline(expires_at)
+        self._schedule_save()
 
     async def invalidate_token(self) -> None:
         data = await self._load()
         data.pop(CACHE_KEY_TOKEN, None)
         data.pop(CACHE_KEY_TOKEN_EXPIRY, None)
-        await self._save()
+        self._token_deadline = None
+        self._schedule_save()
 
     async def get_building_query(
         self,
@@ -99,4 +130,4 @@ class WasteCache:
             "query_param": query_param,
             "last_updated": datetime.now(UTC).isoformat(),
         }
-        await self._save()
+        self._schedule_save()
@@ -6,12 +6,19 @@ import logging
 from typing import Any
 
 import voluptuous as vol
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult, OptionsFlow
 from homeassistant.const import CONF_ADDRESS, CONF_NAME
-from homeassistant.helpers.storage import Store
-
-from .api import AffarsverkenWasteApiClient, ApiError, AuthError
-from .const import DOMAIN, STORAGE_VERSION
+from homeassistant.core import callback
+
+from . import async_get_client
+from .api import ApiError, AuthError
+from .const import (
+    CONF_SCAN_INTERVAL_HOURS,
+    DEFAULT_SCAN_INTERVAL_HOURS,
+    DOMAIN,
+    MAX_SCAN_INTERVAL_HOURS,
+    MIN_SCAN_INTERVAL_HOURS,
+)
 from .helpers import normalize_address
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,6 +35,12 @@ class AffarsverkenWasteConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Affärsverken Waste Collection."""
 
     VERSION = 3
+    MINOR_VERSION = 2
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        return AffarsverkenWasteOptionsFlow()
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
         if user_input is None:
@@ -50,10 +63,8 @@ class AffarsverkenWasteConfigFlow(ConfigFlow, domain=DOMAIN):
 
     async def _validate_address(self, address: str) -> str | None:
         """Return an error key, or None on success."""
-        store = Store(self.hass, STORAGE_VERSION, f"{DOMAIN}.validate")
-        client = AffarsverkenWasteApiClient(self.hass, store)
         try:
-            await client.async_validate(address)
+            await async_get_client(self.hass).async_validate(address)
         except AuthError:
             return "invalid_auth"
         except ApiError as err:
@@ -62,8 +73,6 @@ class AffarsverkenWasteConfigFlow(ConfigFlow, domain=DOMAIN):
         except Exception:
             _LOGGER.exception("Unexpected error validating address")
             return "unknown"
-        finally:
-            await store.async_remove()
         return None
 
     def _show_form(self, errors: dict[str, str] | None = None) -> ConfigFlowResult:
@@ -76,3 +85,24 @@ class AffarsverkenWasteConfigFlow(ConfigFlow, domain=DOMAIN):
     @staticmethod
     def _unique_id_for(address: str) -> str:
         return f"{DOMAIN}_{normalize_address(address).replace(' ', '_')}"
+
+
+class AffarsverkenWasteOptionsFlow(OptionsFlow):
+    """Handle options for an existing entry."""
+
+    async def async_step_init(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        current = self.config_entry.options.get(
+            CONF_SCAN_INTERVAL_HOURS, DEFAULT_SCAN_INTERVAL_HOURS
+        )
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_SCAN_INTERVAL_HOURS, default=current): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_SCAN_INTERVAL_HOURS, max=MAX_SCAN_INTERVAL_HOURS),
+                ),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
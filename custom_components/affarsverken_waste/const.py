@@ -18,9 +18,16 @@ TOKEN_FALLBACK_LIFETIME = timedelta(hours=1)
 # Cache
 BUILDING_CACHE_LIFETIME = timedelta(days=30)
 STORAGE_VERSION = 1
+CACHE_SAVE_DELAY = 10  # seconds; batches token + building writes into one
 CACHE_KEY_TOKEN = "token"
 CACHE_KEY_TOKEN_EXPIRY = "token_expiration_time"
 CACHE_KEY_BUILDINGS = "buildings"
 
 # Polling
-SCAN_INTERVAL = timedelta(hours=12)
+CONF_SCAN_INTERVAL_HOURS = "scan_interval_hours"
+DEFAULT_SCAN_INTERVAL_HOURS = 12
+MIN_SCAN_INTERVAL_HOURS = 1
+MAX_SCAN_INTERVAL_HOURS = 168
+# Random offset added per entry so many instances restarting together don't
+# all hit the API on the same tick.
+SCAN_INTERVAL_JITTER = timedelta(minutes=5)
@@ -3,18 +3,33 @@
 from __future__ import annotations
 
 import logging
-from datetime import date
+import random
+from collections.abc import Mapping
+from datetime import date, timedelta
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import AffarsverkenWasteApiClient, ApiError, AuthError
-from .const import DOMAIN, SCAN_INTERVAL
+from .const import (
+    CONF_SCAN_INTERVAL_HOURS,
+    DEFAULT_SCAN_INTERVAL_HOURS,
+    DOMAIN,
+    SCAN_INTERVAL_JITTER,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def scan_interval(options: Mapping[str, Any]) -> timedelta:
+    """Configured poll interval plus a random jitter of up to SCAN_INTERVAL_JITTER."""
+    hours = options.get(CONF_SCAN_INTERVAL_HOURS, DEFAULT_SCAN_INTERVAL_HOURS)
+    jitter = random.uniform(0, SCAN_INTERVAL_JITTER.total_seconds())
+    return timedelta(hours=hours, seconds=jitter)
+
+
 class AffarsverkenWasteCoordinator(DataUpdateCoordinator[dict[str, date]]):
     """Polls waste collection dates."""
 
@@ -30,7 +45,7 @@ class AffarsverkenWasteCoordinator(DataUpdateCoordinator[dict[str, date]]):
             _LOGGER,
             name=f"{DOMAIN} {address}",
             config_entry=entry,
-            update_interval=SCAN_INTERVAL,
+            update_interval=scan_interval(entry.options),
             always_update=False,
         )
         self._client = client
@@ -34,6 +34,7 @@ async def async_setup_entry(
     coordinator = entry.runtime_data.coordinator
     address = entry.data[CONF_ADDRESS]
     base_name = entry.data.get(CONF_NAME, address)
+    slug = address_slug(address)
 
     known: set[str] = set()
 
@@ -46,7 +47,7 @@ async def async_setup_entry(
             return
         known.update(new_types)
         async_add_entities(
-            AffarsverkenWasteSensor(coordinator, base_name, address, waste_type)
+            AffarsverkenWasteSensor(coordinator, base_name, address, slug, waste_type)
             for waste_type in new_types
         )
 
@@ -66,13 +67,13 @@ class AffarsverkenWasteSensor(CoordinatorEntity[AffarsverkenWasteCoordinator], S
         coordinator: AffarsverkenWasteCoordinator,
         base_name: str,
         address: str,
+        slug: str,
         waste_type: str,
     ) -> None:
         super().__init__(coordinator)
         self._address = address
         self._waste_type = waste_type
 
-        slug = address_slug(address)
         self._attr_name = waste_type
         self._attr_unique_id = f"{DOMAIN}_{slug}_{slugify(waste_type)}"
         self._attr_device_info = DeviceInfo(
@@ -14,7 +14,10 @@ Two jobs:
 
    This works because the pure modules under test (helpers, parsers,
    const) never touch HA themselves — the stubs only need to satisfy
-   ``__init__.py``'s import side effects.
+   ``__init__.py``'s import side effects. The API client and cache are
+   tested with fake sessions/stores; the one thing they need from the
+   stubs is real exception types for ``aiohttp``, since ``except`` rejects
+   mocks.
 """
 
 from __future__ import annotations
@@ -43,8 +46,13 @@ _STUB_MODULES = [
     "homeassistant.helpers.update_coordinator",
     "homeassistant.util",
     "homeassistant.util.dt",
+    "homeassistant.util.json",
     "voluptuous",
 ]
 
 for _name in _STUB_MODULES:
     sys.modules.setdefault(_name, MagicMock(name=_name))
+
+_aiohttp = sys.modules["aiohttp"]
+_aiohttp.ClientError = type("ClientError", (Exception,), {})
+_aiohttp.ClientResponseError = type("ClientResponseError", (_aiohttp.ClientError,), {})
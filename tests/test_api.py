@@ -0,0 +1,115 @@
+"""Tests for token handling in the API client, using a fake HTTP session."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.affarsverken_waste.api import AffarsverkenWasteApiClient, AuthError
+
+URL = "https://example.invalid/waste"
+
+
+class FakeResponse:
+    def __init__(self, status: int, *, body=None, text: str = "") -> None:
+        self.status = status
+        self._body = body
+        self._text = text
+
+    async def __aenter__(self) -> FakeResponse:
+        # Yield so concurrent callers interleave like real network I/O.
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *exc) -> bool:
+        return False
+
+    def raise_for_status(self) -> None:
+        pass
+
+    async def json(self, loads=None):
+        return self._body
+
+    async def text(self) -> str:
+        return self._text
+
+
+class FakeSession:
+    """Issues `token-N` on each login and only accepts the latest one."""
+
+    def __init__(self, *, login_status: int = 200) -> None:
+        self.logins = 0
+        self.valid_token: str | None = None
+        self._login_status = login_status
+
+    def post(self, url, timeout=None) -> FakeResponse:
+        self.logins += 1
+        self.valid_token = f"token-{self.logins}"
+        return FakeResponse(self._login_status, text=self.valid_token)
+
+    def get(self, url, headers, timeout=None) -> FakeResponse:
+        token = headers["Authorization"].removeprefix("Bearer ")
+        if token != self.valid_token:
+            return FakeResponse(401)
+        return FakeResponse(200, body={"token": token})
+
+
+def _make_client(session: FakeSession, persisted: dict | None = None):
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=persisted)
+    client = AffarsverkenWasteApiClient(MagicMock(), store)
+    client._session = session
+    return client
+
+
+def _persisted_token(token: str) -> dict:
+    expires = datetime.now(UTC) + timedelta(hours=1)
+    return {"token": token, "token_expiration_time": expires.isoformat()}
+
+
+class TestTokenRotation:
+    def test_concurrent_rejections_share_one_login(self):
+        # Both entries start with the same stale token and both get a 401;
+        # only the first to take the lock should log in.
+        session = FakeSession()
+        client = _make_client(session, _persisted_token("stale"))
+
+        async def run():
+            return await asyncio.gather(client._authed_get(URL), client._authed_get(URL))
+
+        results = asyncio.run(run())
+        assert session.logins == 1
+        assert results == [{"token": "token-1"}, {"token": "token-1"}]
+
+    def test_rotated_token_is_reused_without_invalidating(self):
+        session = FakeSession()
+        client = _make_client(session, _persisted_token("fresh"))
+
+        async def run():
+            client._cache.invalidate_token = AsyncMock()
+            token = await client._replace_token("stale")
+            return token, client._cache.invalidate_token
+
+        token, invalidate = asyncio.run(run())
+        assert token == "fresh"
+        assert session.logins == 0
+        invalidate.assert_not_awaited()
+
+    def test_cached_rejected_token_is_replaced(self):
+        session = FakeSession()
+        client = _make_client(session, _persisted_token("stale"))
+
+        token = asyncio.run(client._replace_token("stale"))
+        assert token == "token-1"
+        assert session.logins == 1
+
+    def test_rejected_login_raises_without_retry(self):
+        session = FakeSession(login_status=401)
+        client = _make_client(session)
+
+        with pytest.raises(AuthError):
+            asyncio.run(client._authed_get(URL))
+        assert session.logins == 1
@@ -0,0 +1,82 @@
+"""Tests for the persisted token/building cache."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.affarsverken_waste.cache import WasteCache
+
+NOW = datetime(2026, 4, 30, 12, 0, tzinfo=UTC)
+_MODULE = "custom_components.affarsverken_waste.cache"
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+
+def _make_cache(persisted: dict | None = None) -> WasteCache:
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=persisted)
+    return WasteCache(store)
+
+
+class TestTokenDeadline:
+    def test_token_valid_until_deadline(self):
+        cache = _make_cache(
+            {"token": "tok", "token_expiration_time": (NOW + timedelta(hours=1)).isoformat()}
+        )
+        with patch(f"{_MODULE}.datetime", _FrozenDatetime), patch(f"{_MODULE}.time") as clock:
+            clock.monotonic.return_value = 1000.0
+            assert asyncio.run(cache.get_token()) == "tok"
+
+            clock.monotonic.return_value = 1000.0 + 3599
+            assert asyncio.run(cache.get_token()) == "tok"
+
+            clock.monotonic.return_value = 1000.0 + 3600
+            assert asyncio.run(cache.get_token()) is None
+
+    def test_malformed_expiry_is_ignored(self):
+        cache = _make_cache({"token": "tok", "token_expiration_time": "not-a-timestamp"})
+        assert asyncio.run(cache.get_token()) is None
+
+    def test_invalidate_clears_deadline(self):
+        cache = _make_cache(
+            {"token": "tok", "token_expiration_time": (NOW + timedelta(hours=1)).isoformat()}
+        )
+
+        async def run():
+            assert await cache.get_token() == "tok"
+            await cache.invalidate_token()
+            return await cache.get_token()
+
+        with patch(f"{_MODULE}.datetime", _FrozenDatetime), patch(f"{_MODULE}.time") as clock:
+            clock.monotonic.return_value = 1000.0
+            assert asyncio.run(run()) is None
+        assert cache._token_deadline is None
+
+
+class TestConcurrentLoad:
+    def test_slow_load_does_not_drop_concurrent_write(self):
+        # The first caller's store load finishes last; it must not replace
+        # the dict a second caller already loaded and wrote a token into.
+        delays = iter([3, 0])
+
+        async def load():
+            for _ in range(next(delays)):
+                await asyncio.sleep(0)
+            return {}
+
+        store = MagicMock()
+        store.async_load = load
+        cache = WasteCache(store)
+        expires = datetime.now(UTC) + timedelta(hours=1)
+
+        async def run():
+            await asyncio.gather(cache.get_token(), cache.set_token("tok", expires))
+            return await cache.get_token()
+
+        assert asyncio.run(run()) == "tok"
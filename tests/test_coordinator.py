@@ -0,0 +1,39 @@
+"""Tests for coordinator scheduling helpers."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from custom_components.affarsverken_waste.const import (
+    CONF_SCAN_INTERVAL_HOURS,
+    SCAN_INTERVAL_JITTER,
+)
+from custom_components.affarsverken_waste.coordinator import scan_interval
+
+_UNIFORM = "custom_components.affarsverken_waste.coordinator.random.uniform"
+
+
+class TestScanInterval:
+    def test_defaults_to_12_hours(self):
+        with patch(_UNIFORM, return_value=0):
+            assert scan_interval({}) == timedelta(hours=12)
+
+    def test_uses_configured_hours(self):
+        with patch(_UNIFORM, return_value=0):
+            assert scan_interval({CONF_SCAN_INTERVAL_HOURS: 24}) == timedelta(hours=24)
+
+    def test_jitter_drawn_from_full_window(self):
+        with patch(_UNIFORM, return_value=0) as uniform:
+            scan_interval({})
+        uniform.assert_called_once_with(0, SCAN_INTERVAL_JITTER.total_seconds())
+
+    def test_max_jitter_is_added(self):
+        with patch(_UNIFORM, side_effect=lambda low, high: high):
+            result = scan_interval({CONF_SCAN_INTERVAL_HOURS: 6})
+        assert result == timedelta(hours=6) + SCAN_INTERVAL_JITTER
+
+    def test_real_jitter_stays_in_bounds(self):
+        base = timedelta(hours=12)
+        for _ in range(100):
+            assert base <= scan_interval({}) <= base + SCAN_INTERVAL_JITTER
@@ -104,3 +104,16 @@ class TestBuildPickupAttributes:
         attrs = build_pickup_attributes(today, today, "Restavfall", "Foo 1")
         assert attrs["waste_type"] == "Restavfall"
         assert attrs["address"] == "Foo 1"
+
+    def test_attribute_order(self, today):
+        # Order is what users see in the UI; keep it stable.
+        assert list(build_pickup_attributes(today, today, "Foo", "Foo 1")) == [
+            "days_until_pickup",
+            "pickup_date",
+            "waste_type",
+            "address",
+            "is_today",
+            "is_tomorrow",
+            "is_this_week",
+            "pickup_weekday",
+        ]